@@ -0,0 +1,375 @@
+r"""Бенчмарки для змейки и крестиков-ноликов.
+
+Запуск замеров и сохранение результатов в JSON:
+
+    python benchmarks/bench.py run -o benchmarks/results.json
+
+Сравнение с сохранённым эталоном (код возврата 1 при регрессии или
+если замера из эталона нет в результатах, см. --allow-missing):
+
+    python benchmarks/bench.py compare benchmarks/baseline.json \
+        benchmarks/results.json --threshold 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import timeit
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR / 'the_snake-main'))
+sys.path.append(str(BASE_DIR / 'tic_tac_toe'))
+
+# Прячем окно pygame - рисуем через dummy-драйвер SDL
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+import the_snake  # noqa: E402
+from gameparts import Board  # noqa: E402
+
+# Зерно генератора случайных чисел для воспроизводимости замеров
+SEED = 42
+
+# Размеры поля змейки в клетках (высота должна быть чётной)
+BOARD_SIZES = ((32, 24), (64, 48))
+
+# Длины змейки
+SNAKE_LENGTHS = (1, 64, 512)
+
+# Доля поля, занятая змейкой, при перемещении яблока
+FILL_RATIOS = (0.1, 0.5, 0.9)
+
+# Размеры поля крестиков-ноликов
+FIELD_SIZES = (3, 10, 50)
+
+# Допустимое замедление относительно эталона
+DEFAULT_THRESHOLD = 0.1
+
+
+@contextmanager
+def snake_board(width, height):
+    """Временно меняет размер поля змейки (в клетках)."""
+    names = ('SCREEN_WIDTH', 'SCREEN_HEIGHT', 'GRID_WIDTH', 'GRID_HEIGHT')
+    saved = {name: getattr(the_snake, name) for name in names}
+    the_snake.GRID_WIDTH = width
+    the_snake.GRID_HEIGHT = height
+    the_snake.SCREEN_WIDTH = width * the_snake.GRID_SIZE
+    the_snake.SCREEN_HEIGHT = height * the_snake.GRID_SIZE
+    the_snake.screen = pygame.display.set_mode(
+        (the_snake.SCREEN_WIDTH, the_snake.SCREEN_HEIGHT), 0, 32
+    )
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(the_snake, name, value)
+        the_snake.screen = pygame.display.set_mode(
+            (the_snake.SCREEN_WIDTH, the_snake.SCREEN_HEIGHT), 0, 32
+        )
+
+
+def snake_cycle():
+    """Возвращает гамильтонов цикл по клеткам поля змейки.
+
+    Цикл идёт "змейкой" по строкам, не заходя в нулевой столбец,
+    и возвращается наверх по нулевому столбцу.
+    """
+    width, height = the_snake.GRID_WIDTH, the_snake.GRID_HEIGHT
+    cells = []
+    for row in range(height):
+        columns = range(1, width)
+        if row % 2:
+            columns = reversed(columns)
+        cells.extend((column, row) for column in columns)
+    cells.extend((0, row) for row in reversed(range(height)))
+    # Первая строка начинается с нулевого столбца
+    cells.insert(0, cells.pop())
+    return [
+        (x * the_snake.GRID_SIZE, y * the_snake.GRID_SIZE) for x, y in cells
+    ]
+
+
+def make_snake(length):
+    """Создаёт змейку заданной длины, уложенную вдоль цикла по полю.
+
+    Возвращает змейку и словарь "клетка - направление к следующей клетке
+    цикла", следуя которому змейка никогда не врежется в себя.
+    """
+    cycle = snake_cycle()
+    next_direction = {}
+    for index, (x, y) in enumerate(cycle):
+        next_x, next_y = cycle[(index + 1) % len(cycle)]
+        next_direction[(x, y)] = (
+            (next_x - x) // the_snake.GRID_SIZE,
+            (next_y - y) // the_snake.GRID_SIZE,
+        )
+    snake = the_snake.Snake()
+    snake.positions = cycle[length - 1::-1]
+    snake.length = length
+    snake.direction = next_direction[snake.get_head_position()]
+    return snake, next_direction
+
+
+def bench_move(length):
+    """Готовит замер движения змейки."""
+    snake, _ = make_snake(length)
+    return snake.move
+
+
+def bench_collision(length):
+    """Готовит замер проверки столкновения змейки с собой."""
+    snake, _ = make_snake(length)
+    return snake.check_collision
+
+
+def bench_snake_draw(length):
+    """Готовит замер отрисовки змейки."""
+    snake, _ = make_snake(length)
+    snake.move()
+    return snake.draw
+
+
+def bench_game_tick(length):
+    """Готовит замер полного шага игрового цикла."""
+    snake, next_direction = make_snake(length)
+    apple = the_snake.Apple()
+    # Яблоко за пределами поля, чтобы длина змейки не менялась
+    apple.position = (-the_snake.GRID_SIZE, -the_snake.GRID_SIZE)
+
+    def tick():
+        snake.next_direction = next_direction[snake.get_head_position()]
+        the_snake.game_tick(snake, apple)
+    return tick
+
+
+def bench_randomize(length):
+    """Готовит замер перемещения яблока на поле, занятом змейкой."""
+    snake, _ = make_snake(length)
+    apple = the_snake.Apple()
+    return partial(apple.randomize_position, snake.positions)
+
+
+def bench_apple_draw():
+    """Готовит замер отрисовки яблока."""
+    return the_snake.Apple().draw
+
+
+SNAKE_LENGTH_BENCHES = (
+    ('snake.move', bench_move),
+    ('snake.check_collision', bench_collision),
+    ('snake.draw', bench_snake_draw),
+    ('game_tick', bench_game_tick),
+)
+
+
+def snake_cases():
+    """Перечисляет замеры змейки: (имя, параметры, поле, фабрика замера)."""
+    for width, height in BOARD_SIZES:
+        board = f'{width}x{height}'
+        cells = width * height
+
+        for length in SNAKE_LENGTHS:
+            if length >= cells:
+                continue
+            params = {'board': board, 'length': length}
+            for group, factory in SNAKE_LENGTH_BENCHES:
+                yield group, params, (width, height), partial(factory, length)
+
+        for ratio in FILL_RATIOS:
+            yield (
+                'apple.randomize_position', {'board': board, 'fill': ratio},
+                (width, height), partial(bench_randomize, int(cells * ratio))
+            )
+
+        yield 'apple.draw', {'board': board}, (width, height), bench_apple_draw
+
+
+def filled_board(size):
+    """Создаёт заполненное поле, на котором никто не победил.
+
+    Строки чередуют X и O, а каждые две строки узор сдвигается на клетку,
+    поэтому ни столбцы, ни диагонали не заполнены одним знаком.
+    """
+    board = Board(size)
+    for row in range(size):
+        for col in range(size):
+            board.make_move(row, col, 'X' if (col + row // 2) % 2 else 'O')
+    return board
+
+
+def bench_check_win(size):
+    """Готовит замер проверки победы на поле без победителя."""
+    return partial(filled_board(size).check_win, 'X')
+
+
+def bench_is_board_full(size):
+    """Готовит замер проверки заполненности поля."""
+    return filled_board(size).is_board_full
+
+
+def bench_make_move(size):
+    """Готовит замер хода в центр поля."""
+    return partial(filled_board(size).make_move, size // 2, size // 2, 'X')
+
+
+BOARD_BENCHES = (
+    ('board.check_win', bench_check_win),
+    ('board.is_board_full', bench_is_board_full),
+    ('board.make_move', bench_make_move),
+)
+
+
+def tic_tac_toe_cases():
+    """Перечисляет замеры крестиков-ноликов."""
+    for size in FIELD_SIZES:
+        for group, factory in BOARD_BENCHES:
+            yield group, {'field': size}, None, partial(factory, size)
+
+
+def case_name(group, params):
+    """Формирует имя замера из группы и параметров."""
+    suffix = ','.join(f'{key}={value}' for key, value in params.items())
+    return f'{group}[{suffix}]'
+
+
+def measure(func, repeat):
+    """Замеряет время одного вызова функции в секундах."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    timings = [total / number for total in timer.repeat(repeat, number)]
+    return {
+        'number': number,
+        'repeat': repeat,
+        'best': min(timings),
+        'median': statistics.median(timings),
+    }
+
+
+def run(output, repeat, pattern=None):
+    """Выполняет все замеры и сохраняет результаты в JSON."""
+    pygame.init()
+    results = {}
+    cases = list(snake_cases()) + list(tic_tac_toe_cases())
+    for group, params, board, factory in cases:
+        name = case_name(group, params)
+        if pattern and pattern not in name:
+            continue
+        random.seed(SEED)
+        if board is None:
+            result = measure(factory(), repeat)
+        else:
+            with snake_board(*board):
+                result = measure(factory(), repeat)
+        results[name] = {'group': group, 'params': params, **result}
+        print(f'{name:<60} {result["median"] * 1e6:12.3f} мкс')
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'pygame': pygame.version.ver,
+            'seed': SEED,
+        },
+        'benchmarks': results,
+    }
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f'Результаты сохранены в {output}')
+
+
+def compare(baseline_path, current_path, threshold, allow_missing=False):
+    """Сравнивает результаты с эталоном.
+
+    Возвращает количество замеров, замедлившихся сильнее порога, вместе
+    с замерами эталона, которых нет в текущих результатах (если их
+    отсутствие не разрешено явно).
+    """
+    with open(baseline_path, encoding='utf-8') as file:
+        baseline = json.load(file)['benchmarks']
+    with open(current_path, encoding='utf-8') as file:
+        current = json.load(file)['benchmarks']
+
+    regressions = 0
+    missing = 0
+    for name in sorted(baseline.keys() | current.keys()):
+        if name not in current:
+            print(f'{name:<60} нет в текущих результатах')
+            missing += 1
+            continue
+        if name not in baseline:
+            print(f'{name:<60} нет в эталоне')
+            continue
+        ratio = current[name]['median'] / baseline[name]['median']
+        if ratio > 1 + threshold:
+            status = 'РЕГРЕССИЯ'
+            regressions += 1
+        elif ratio < 1 - threshold:
+            status = 'ускорение'
+        else:
+            status = ''
+        print(f'{name:<60} {ratio:7.2f}x {status}')
+
+    print(f'Регрессий: {regressions} (порог {threshold:.0%})')
+    if missing:
+        print(f'Нет в текущих результатах: {missing}')
+    if allow_missing:
+        return regressions
+    return regressions + missing
+
+
+def parse_args(argv=None):
+    """Разбирает аргументы командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='выполнить замеры')
+    run_parser.add_argument(
+        '-o', '--output', default='bench_results.json',
+        help='файл для сохранения результатов'
+    )
+    run_parser.add_argument(
+        '-r', '--repeat', type=int, default=5,
+        help='количество повторов каждого замера'
+    )
+    run_parser.add_argument(
+        '-k', '--filter', dest='pattern',
+        help='выполнить только замеры, имя которых содержит подстроку'
+    )
+
+    compare_parser = commands.add_parser(
+        'compare', help='сравнить результаты с эталоном'
+    )
+    compare_parser.add_argument('baseline', help='файл эталона')
+    compare_parser.add_argument('current', help='файл текущих результатов')
+    compare_parser.add_argument(
+        '-t', '--threshold', type=float, default=DEFAULT_THRESHOLD,
+        help='допустимое относительное замедление'
+    )
+    compare_parser.add_argument(
+        '--allow-missing', action='store_true',
+        help='не считать ошибкой замеры эталона, которых нет в результатах'
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Точка входа командной строки."""
+    args = parse_args(argv)
+    if args.command == 'run':
+        run(args.output, args.repeat, args.pattern)
+        return 0
+    failures = compare(
+        args.baseline, args.current, args.threshold, args.allow_missing
+    )
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,379 @@
+r"""Перебор параметров змейки на безголовых играх.
+
+Каждая пара (конфигурация, зерно) - одна игра бота без отрисовки.
+Игры раздаются пулу процессов, а результаты процессы пишут прямо
+в общую таблицу NumPy, отображённую в память из .npy-файла.
+Повторный запуск с тем же файлом доигрывает только незавершённые игры.
+
+    python sweep.py results.npy --policy greedy random \
+        --grid 32x24 16x12 --growth 1 2 --seeds 1000
+"""
+import argparse
+import json
+import os
+import random
+import signal
+import sys
+import time
+from itertools import product
+from multiprocessing import Pool
+from pathlib import Path
+
+import numpy as np
+
+# Прячем окно pygame - игры идут без отрисовки
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+# Не даём SDL перехватывать SIGTERM, иначе пул не завершит процессы
+os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+
+import the_snake  # noqa: E402
+
+# Причины окончания игры:
+CAUSE_TIMEOUT = 0  # закончился лимит ходов
+CAUSE_COLLISION = 1  # змейка врезалась в себя
+CAUSE_STARVED = 2  # змейка слишком долго не находила яблоко
+CAUSE_WON = 3  # змейка заняла всё поле
+
+CAUSE_NAMES = ('timeout', 'collision', 'starved', 'won')
+
+# Строка таблицы результатов - одна игра
+RESULT_DTYPE = np.dtype([
+    ('config', 'u4'),
+    ('seed', 'u8'),
+    ('score', 'u4'),
+    ('ticks', 'u4'),
+    ('cause', 'u1'),
+    ('time_per_tick', 'f8'),
+    ('done', '?'),
+])
+
+DIRECTIONS = (the_snake.UP, the_snake.DOWN, the_snake.LEFT, the_snake.RIGHT)
+
+# Таблица результатов и параметры перебора в процессе-исполнителе
+_results = None
+_sweep = None
+
+
+def random_policy(snake, apple):
+    """Выбирает случайное направление, не разворачиваясь назад."""
+    dir_x, dir_y = snake.direction
+    return random.choice(
+        [direction for direction in DIRECTIONS
+         if direction != (-dir_x, -dir_y)]
+    )
+
+
+def greedy_policy(snake, apple):
+    """Двигается к яблоку кратчайшим путём, избегая столкновений."""
+    head_x, head_y = snake.get_head_position()
+    dir_x, dir_y = snake.direction
+    width, height = the_snake.SCREEN_WIDTH, the_snake.SCREEN_HEIGHT
+
+    def distance(position):
+        dx = (apple.position[0] - position[0]) % width
+        dy = (apple.position[1] - position[1]) % height
+        return min(dx, width - dx) + min(dy, height - dy)
+
+    candidates = []
+    for direction in DIRECTIONS:
+        if direction == (-dir_x, -dir_y):
+            continue
+        position = (
+            (head_x + direction[0] * the_snake.GRID_SIZE) % width,
+            (head_y + direction[1] * the_snake.GRID_SIZE) % height,
+        )
+        # Хвост уйдёт с места, только если змейка сейчас не растёт
+        body = snake.positions
+        if len(body) >= snake.length:
+            body = body[:-1]
+        blocked = position in body
+        candidates.append((blocked, distance(position), direction))
+    return min(candidates)[2]
+
+
+POLICIES = {
+    'random': random_policy,
+    'greedy': greedy_policy,
+}
+
+
+def set_grid(width, height):
+    """Задаёт размер поля змейки в клетках."""
+    the_snake.GRID_WIDTH = width
+    the_snake.GRID_HEIGHT = height
+    the_snake.SCREEN_WIDTH = width * the_snake.GRID_SIZE
+    the_snake.SCREEN_HEIGHT = height * the_snake.GRID_SIZE
+
+
+def play_game(config, seed, max_ticks, max_idle):
+    """Играет одну игру бота.
+
+    Возвращает счёт, число прожитых ходов, причину окончания игры
+    и среднее время одного хода в секундах.
+    """
+    random.seed(seed)
+    set_grid(config['width'], config['height'])
+    cells = config['width'] * config['height']
+    policy = POLICIES[config['policy']]
+
+    snake = the_snake.Snake()
+    # При нечётном размере поля центр экрана не попадает на клетку сетки
+    snake.positions = [(
+        config['width'] // 2 * the_snake.GRID_SIZE,
+        config['height'] // 2 * the_snake.GRID_SIZE,
+    )]
+    apple = the_snake.Apple()
+    apple.randomize_position(snake.positions)
+
+    score = 0
+    idle = 0
+    cause = CAUSE_TIMEOUT
+    ticks = 0
+    start = time.perf_counter()
+    while ticks < max_ticks:
+        ticks += 1
+        snake.next_direction = policy(snake, apple)
+        snake.update_direction()
+        snake.move()
+
+        if snake.get_head_position() == apple.position:
+            score += 1
+            idle = 0
+            snake.length += config['growth']
+            if snake.length >= cells:
+                cause = CAUSE_WON
+                break
+            apple.randomize_position(snake.positions)
+
+        if snake.check_collision():
+            cause = CAUSE_COLLISION
+            break
+
+        idle += 1
+        if idle > max_idle:
+            cause = CAUSE_STARVED
+            break
+    elapsed = time.perf_counter() - start
+    return score, ticks, cause, elapsed / ticks if ticks else 0.0
+
+
+def init_worker(path, sweep):
+    """Открывает общую таблицу результатов в процессе-исполнителе."""
+    global _results, _sweep
+    # Прерывание обрабатывает главный процесс
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Пул завершает процессы через SIGTERM, SDL не должен его перехватывать
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    _results = np.load(path, mmap_mode='r+')
+    _sweep = sweep
+
+
+def run_jobs(indices):
+    """Играет игры из пачки и записывает результаты в общую таблицу."""
+    for index in indices:
+        row = _results[index]
+        score, ticks, cause, time_per_tick = play_game(
+            _sweep['configs'][row['config']], int(row['seed']),
+            _sweep['max_ticks'], _sweep['max_idle'],
+        )
+        _results['score'][index] = score
+        _results['ticks'][index] = ticks
+        _results['cause'][index] = cause
+        _results['time_per_tick'][index] = time_per_tick
+        # Флаг выставляется последним, чтобы прерванная игра переигралась
+        _results['done'][index] = True
+    return len(indices)
+
+
+def open_results(path, sweep):
+    """Создаёт таблицу результатов или открывает её для продолжения."""
+    meta_path = path.with_suffix('.json')
+    if path.exists():
+        if not meta_path.exists():
+            raise SystemExit(
+                f'Не найден файл {meta_path} с параметрами перебора для '
+                f'{path}. Укажите другой файл результатов.'
+            )
+        with open(meta_path, encoding='utf-8') as file:
+            saved = json.load(file)
+        if saved != sweep:
+            raise SystemExit(
+                f'Параметры перебора не совпадают с сохранёнными в '
+                f'{meta_path}. Укажите другой файл результатов.'
+            )
+        return np.load(path, mmap_mode='r+')
+
+    with open(meta_path, 'w', encoding='utf-8') as file:
+        json.dump(sweep, file, ensure_ascii=False, indent=2)
+    seeds = sweep['seeds']
+    results = np.lib.format.open_memmap(
+        path, mode='w+', dtype=RESULT_DTYPE,
+        shape=(len(sweep['configs']) * seeds,)
+    )
+    results['config'] = np.repeat(
+        np.arange(len(sweep['configs']), dtype='u4'), seeds
+    )
+    results['seed'] = np.tile(
+        np.arange(sweep['seed_base'], sweep['seed_base'] + seeds),
+        len(sweep['configs'])
+    )
+    results.flush()
+    return results
+
+
+def run_sweep(path, sweep, workers, chunk_size, report_interval):
+    """Раздаёт незавершённые игры пулу процессов и сообщает о прогрессе."""
+    results = open_results(path, sweep)
+    pending = np.flatnonzero(~results['done'])
+    total = len(results)
+    done = total - len(pending)
+    print(f'Игр всего: {total}, уже сыграно: {done}')
+
+    # Пачки нарезаются по мере отправки, а не списком заранее
+    chunks = (
+        pending[start:start + chunk_size]
+        for start in range(0, len(pending), chunk_size)
+    )
+    start = last_report = time.perf_counter()
+    played = 0
+    try:
+        with Pool(workers, init_worker, (str(path), sweep)) as pool:
+            for count in pool.imap_unordered(run_jobs, chunks):
+                played += count
+                now = time.perf_counter()
+                if now - last_report >= report_interval:
+                    last_report = now
+                    print(
+                        f'{done + played}/{total} игр, '
+                        f'{played / (now - start):.1f} игр/с'
+                    )
+    except KeyboardInterrupt:
+        print('Прервано. Повторите запуск, чтобы продолжить.')
+        raise SystemExit(1)
+    finally:
+        results.flush()
+
+    elapsed = time.perf_counter() - start
+    if played:
+        print(f'Сыграно {played} игр за {elapsed:.1f} с, '
+              f'{played / elapsed:.1f} игр/с')
+    return results
+
+
+def print_summary(results, configs):
+    """Выводит средние показатели по каждой конфигурации."""
+    for index, config in enumerate(configs):
+        games = results[(results['config'] == index) & results['done']]
+        if not len(games):
+            continue
+        causes = np.bincount(games['cause'], minlength=len(CAUSE_NAMES))
+        causes_text = ', '.join(
+            f'{name}={count}' for name, count in zip(CAUSE_NAMES, causes)
+        )
+        print(
+            f'{config["policy"]} {config["width"]}x{config["height"]} '
+            f'growth={config["growth"]}: '
+            f'счёт {games["score"].mean():.2f}, '
+            f'ходов {games["ticks"].mean():.1f}, '
+            f'{games["time_per_tick"].mean() * 1e6:.2f} мкс/ход; '
+            f'{causes_text}'
+        )
+
+
+def parse_grid(value):
+    """Разбирает размер поля вида 32x24."""
+    try:
+        width, height = (int(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f'Размер поля должен быть вида 32x24, получено: {value}'
+        )
+    return width, height
+
+
+def parse_args(argv=None):
+    """Разбирает аргументы командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('output', type=Path, help='файл таблицы (.npy)')
+    parser.add_argument(
+        '--policy', nargs='+', choices=sorted(POLICIES), default=['greedy'],
+        help='стратегии бота'
+    )
+    parser.add_argument(
+        '--grid', nargs='+', type=parse_grid,
+        default=[(the_snake.GRID_WIDTH, the_snake.GRID_HEIGHT)],
+        help='размеры поля в клетках, например 32x24'
+    )
+    parser.add_argument(
+        '--growth', nargs='+', type=int, default=[1],
+        help='на сколько клеток змейка растёт за яблоко'
+    )
+    parser.add_argument(
+        '--seeds', type=int, default=100,
+        help='количество игр на конфигурацию'
+    )
+    parser.add_argument(
+        '--seed-base', type=int, default=0, help='первое зерно'
+    )
+    parser.add_argument(
+        '--max-ticks', type=int, default=10000,
+        help='лимит ходов в одной игре'
+    )
+    parser.add_argument(
+        '--max-idle', type=int, default=1000,
+        help='лимит ходов без яблока'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=os.cpu_count(),
+        help='количество процессов'
+    )
+    parser.add_argument(
+        '--chunk-size', type=int, default=16,
+        help='сколько игр процесс берёт за раз'
+    )
+    parser.add_argument(
+        '--report-interval', type=float, default=5.0,
+        help='как часто печатать прогресс, секунд'
+    )
+    args = parser.parse_args(argv)
+    for name in ('seeds', 'max_ticks', 'max_idle', 'workers', 'chunk_size'):
+        if getattr(args, name) < 1:
+            option = name.replace('_', '-')
+            parser.error(f'--{option} должно быть положительным числом')
+    if args.seed_base < 0:
+        parser.error('--seed-base не может быть отрицательным')
+    if args.report_interval <= 0:
+        parser.error('--report-interval должно быть положительным числом')
+    if any(growth < 0 for growth in args.growth):
+        parser.error('--growth не может быть отрицательным')
+    for width, height in args.grid:
+        if width < 2 or height < 2:
+            parser.error('Размер поля должен быть не меньше 2x2')
+    return args
+
+
+def main(argv=None):
+    """Точка входа командной строки."""
+    args = parse_args(argv)
+    configs = [
+        {'policy': policy, 'width': width, 'height': height,
+         'growth': growth}
+        for policy, (width, height), growth
+        in product(args.policy, args.grid, args.growth)
+    ]
+    sweep = {
+        'configs': configs,
+        'seeds': args.seeds,
+        'seed_base': args.seed_base,
+        'max_ticks': args.max_ticks,
+        'max_idle': args.max_idle,
+    }
+    results = run_sweep(
+        args.output, sweep, args.workers, args.chunk_size,
+        args.report_interval,
+    )
+    print_summary(results, configs)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import pytest
+
+
+def all_cells(module):
+    return [
+        (x * module.GRID_SIZE, y * module.GRID_SIZE)
+        for x in range(module.GRID_WIDTH)
+        for y in range(module.GRID_HEIGHT)
+    ]
+
+
+def test_apple_never_spawns_on_occupied(apple, _the_snake):
+    cells = all_cells(_the_snake)
+    free = cells[len(cells) // 2]
+    occupied = set(cells) - {free}
+    for _ in range(20):
+        apple.randomize_position(occupied)
+        assert apple.position == free
+
+
+def test_apple_spawns_on_grid(apple, _the_snake):
+    cells = set(all_cells(_the_snake))
+    for _ in range(100):
+        apple.randomize_position()
+        assert apple.position in cells
+
+
+def test_no_collision_for_straight_snake(snake, _the_snake):
+    size = _the_snake.GRID_SIZE
+    snake.positions = [(3 * size, 0), (2 * size, 0), (size, 0), (0, 0)]
+    snake.length = 4
+    assert not snake.check_collision()
+
+
+def test_collision_when_head_hits_body(snake, _the_snake):
+    size = _the_snake.GRID_SIZE
+    snake.positions = [(size, 0), (size, size), (0, size), (0, 0), (size, 0)]
+    snake.length = 5
+    assert snake.check_collision()
+
+
+def test_game_tick_grows_snake_on_apple(snake, apple, _the_snake):
+    head_x, head_y = snake.get_head_position()
+    apple.position = (head_x + _the_snake.GRID_SIZE, head_y)
+    snake.direction = _the_snake.RIGHT
+    _the_snake.game_tick(snake, apple)
+    assert snake.length == 2
+    assert snake.get_head_position() == (head_x + _the_snake.GRID_SIZE, head_y)
+    assert apple.position not in snake.positions
+
+
+def test_game_tick_resets_snake_on_collision(snake, apple, _the_snake):
+    size = _the_snake.GRID_SIZE
+    # Голова идёт вниз в клетку, занятую телом
+    snake.positions = [
+        (size, size), (2 * size, size), (2 * size, 2 * size),
+        (size, 2 * size), (0, 2 * size),
+    ]
+    snake.length = 5
+    snake.direction = _the_snake.DOWN
+    apple.position = (-size, -size)
+    _the_snake.game_tick(snake, apple)
+    assert snake.length == 1
+    assert snake.positions == [
+        (_the_snake.SCREEN_WIDTH // 2, _the_snake.SCREEN_HEIGHT // 2)
+    ]
+
+
+@pytest.mark.parametrize('direction_name', ('UP', 'DOWN', 'LEFT', 'RIGHT'))
+def test_game_tick_moves_snake(snake, apple, _the_snake, direction_name):
+    direction = getattr(_the_snake, direction_name)
+    head_x, head_y = snake.get_head_position()
+    snake.direction = direction
+    apple.position = (-_the_snake.GRID_SIZE, -_the_snake.GRID_SIZE)
+    _the_snake.game_tick(snake, apple)
+    assert snake.get_head_position() == (
+        (head_x + direction[0] * _the_snake.GRID_SIZE)
+        % _the_snake.SCREEN_WIDTH,
+        (head_y + direction[1] * _the_snake.GRID_SIZE)
+        % _the_snake.SCREEN_HEIGHT,
+    )
+    assert snake.length == 1
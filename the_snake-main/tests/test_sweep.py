@@ -0,0 +1,161 @@
+import json
+
+import numpy as np
+import pytest
+
+import sweep
+
+
+CONFIG = {'policy': 'greedy', 'width': 16, 'height': 12, 'growth': 1}
+
+
+@pytest.fixture(autouse=True)
+def restore_grid(monkeypatch):
+    # play_game меняет размер поля в модуле the_snake
+    for name in ('SCREEN_WIDTH', 'SCREEN_HEIGHT', 'GRID_WIDTH', 'GRID_HEIGHT'):
+        monkeypatch.setattr(
+            sweep.the_snake, name, getattr(sweep.the_snake, name)
+        )
+
+
+def make_sweep(seeds=4, **config):
+    return {
+        'configs': [{**CONFIG, **config}],
+        'seeds': seeds,
+        'seed_base': 0,
+        'max_ticks': 200,
+        'max_idle': 100,
+    }
+
+
+@pytest.mark.parametrize('policy', sorted(sweep.POLICIES))
+def test_same_seed_gives_same_game(policy):
+    config = {**CONFIG, 'policy': policy}
+    first = sweep.play_game(config, 7, 1000, 500)
+    second = sweep.play_game(config, 7, 1000, 500)
+    assert first[:3] == second[:3]
+
+
+@pytest.mark.parametrize('width, height', ((15, 12), (16, 11), (15, 11)))
+def test_odd_grid_is_playable(width, height):
+    config = {**CONFIG, 'width': width, 'height': height}
+    scores = [sweep.play_game(config, seed, 1000, 500)[0] for seed in range(3)]
+    assert all(score > 0 for score in scores)
+
+
+def test_timeout_cause():
+    score, ticks, cause, _ = sweep.play_game(CONFIG, 0, 5, 1000)
+    assert ticks == 5
+    assert cause == sweep.CAUSE_TIMEOUT
+
+
+def test_starved_cause():
+    _, ticks, cause, _ = sweep.play_game(CONFIG, 0, 1000, 2)
+    assert ticks == 3
+    assert cause == sweep.CAUSE_STARVED
+
+
+def test_won_cause():
+    config = {**CONFIG, 'width': 3, 'height': 2, 'growth': 10}
+    score, _, cause, _ = sweep.play_game(config, 0, 1000, 1000)
+    assert score == 1
+    assert cause == sweep.CAUSE_WON
+
+
+def test_collision_cause():
+    config = {**CONFIG, 'width': 8, 'height': 8, 'growth': 3}
+    _, _, cause, _ = sweep.play_game(config, 0, 10000, 1000)
+    assert cause == sweep.CAUSE_COLLISION
+
+
+def test_zero_max_ticks():
+    assert sweep.play_game(CONFIG, 0, 0, 1000) == (
+        0, 0, sweep.CAUSE_TIMEOUT, 0.0
+    )
+
+
+def make_growing_snake(length):
+    # Голова в (1, 1) движется вверх, хвост слева от головы
+    size = sweep.the_snake.GRID_SIZE
+    snake = sweep.the_snake.Snake()
+    snake.positions = [
+        (size, size), (size, 2 * size), (0, 2 * size), (0, size)
+    ]
+    snake.length = length
+    snake.direction = sweep.the_snake.UP
+    apple = sweep.the_snake.Apple()
+    # Ближе всего к яблоку клетка хвоста
+    apple.position = (sweep.the_snake.SCREEN_WIDTH - 2 * size, size)
+    return snake, apple
+
+
+def test_greedy_steps_on_moving_tail():
+    snake, apple = make_growing_snake(4)
+    assert sweep.greedy_policy(snake, apple) == sweep.the_snake.LEFT
+
+
+def test_greedy_avoids_tail_while_growing():
+    snake, apple = make_growing_snake(5)
+    assert sweep.greedy_policy(snake, apple) != sweep.the_snake.LEFT
+
+
+def test_open_results_creates_table(tmp_path):
+    path = tmp_path / 'results.npy'
+    params = make_sweep(seeds=3)
+    results = sweep.open_results(path, params)
+    assert len(results) == 3
+    assert list(results['seed']) == [0, 1, 2]
+    assert not results['done'].any()
+    with open(path.with_suffix('.json'), encoding='utf-8') as file:
+        assert json.load(file) == params
+
+
+def test_open_results_refuses_mismatched_sweep(tmp_path):
+    path = tmp_path / 'results.npy'
+    sweep.open_results(path, make_sweep(seeds=3))
+    with pytest.raises(SystemExit):
+        sweep.open_results(path, make_sweep(seeds=4))
+
+
+def test_open_results_refuses_missing_sidecar(tmp_path):
+    path = tmp_path / 'results.npy'
+    sweep.open_results(path, make_sweep())
+    path.with_suffix('.json').unlink()
+    with pytest.raises(SystemExit):
+        sweep.open_results(path, make_sweep())
+
+
+def test_resume_plays_only_pending_rows(tmp_path):
+    path = tmp_path / 'results.npy'
+    params = make_sweep(seeds=6)
+    results = sweep.open_results(path, params)
+    results['score'][:3] = 999
+    results['done'][:3] = True
+    results.flush()
+    del results
+
+    sweep.run_sweep(path, params, 1, 2, 1000)
+    results = np.load(path)
+    assert results['done'].all()
+    assert list(results['score'][:3]) == [999] * 3
+    for row in results[3:]:
+        expected = sweep.play_game(
+            CONFIG, int(row['seed']), params['max_ticks'], params['max_idle']
+        )
+        assert (row['score'], row['ticks'], row['cause']) == expected[:3]
+
+
+@pytest.mark.parametrize('option, value', (
+    ('--seeds', '0'),
+    ('--max-ticks', '0'),
+    ('--max-idle', '0'),
+    ('--workers', '0'),
+    ('--chunk-size', '0'),
+    ('--seed-base', '-1'),
+    ('--growth', '-1'),
+    ('--grid', '1x1'),
+    ('--grid', '16by12'),
+))
+def test_parse_args_rejects_invalid_values(option, value):
+    with pytest.raises(SystemExit):
+        sweep.parse_args(['results.npy', option, value])
@@ -60,12 +60,15 @@ class Apple(GameObject):
         self.randomize_position()
         self.body_color = APPLE_COLOR
 
-    def randomize_position(self):
-        """Устанавливает случайную позицию для яблока."""
-        self.position = (
-            randint(0, GRID_WIDTH - 1) * GRID_SIZE,
-            randint(0, GRID_HEIGHT - 1) * GRID_SIZE
-        )
+    def randomize_position(self, occupied=()):
+        """Устанавливает случайную позицию для яблока вне занятых клеток."""
+        while True:
+            self.position = (
+                randint(0, GRID_WIDTH - 1) * GRID_SIZE,
+                randint(0, GRID_HEIGHT - 1) * GRID_SIZE
+            )
+            if self.position not in occupied:
+                break
 
     def draw(self):
         """Отрисовывает яблоко на экране."""
@@ -127,6 +130,10 @@ class Snake(GameObject):
         """Возвращает позицию головы змейки."""
         return self.positions[0]
 
+    def check_collision(self):
+        """Проверяет, столкнулась ли голова змейки с её телом."""
+        return self.get_head_position() in self.positions[1:]
+
     def draw(self):
         """Отрисовывает змейку на экране."""
         # Отрисовываем все сегменты тела, кроме головы
@@ -163,6 +170,39 @@ def handle_keys(snake):
                 snake.next_direction = RIGHT
 
 
+def game_tick(snake, apple):
+    """Выполняет один шаг игрового цикла без ограничения FPS."""
+    # Обработка событий клавиш
+    handle_keys(snake)
+
+    # Обновление направления движения змейки
+    snake.update_direction()
+
+    # Движение змейки
+    snake.move()
+
+    # Проверка, съела ли змейка яблоко
+    if snake.get_head_position() == apple.position:
+        # Увеличение длины змейки
+        snake.length += 1
+        # Перемещение яблока так, чтобы оно не появилось на теле змейки
+        apple.randomize_position(snake.positions)
+
+    # Проверка столкновений змейки с самой собой
+    if snake.check_collision():
+        # Сброс игры при столкновении
+        print(f"Игра окончена! Счёт: {snake.length - 1}")
+        snake.reset()
+
+    # Отрисовка игровых объектов
+    screen.fill(BOARD_BACKGROUND_COLOR)  # Очистка экрана
+    snake.draw()  # Отрисовка змейки
+    apple.draw()  # Отрисовка яблока
+
+    # Обновление экрана
+    pygame.display.update()
+
+
 def main():
     """Главная функция игры."""
     # Инициализация PyGame:
@@ -177,39 +217,7 @@ def main():
         # Ограничение FPS
         clock.tick(SPEED)
 
-        # Обработка событий клавиш
-        handle_keys(snake)
-
-        # Обновление направления движения змейки
-        snake.update_direction()
-
-        # Движение змейки
-        snake.move()
-
-        # Проверка, съела ли змейка яблоко
-        if snake.get_head_position() == apple.position:
-            # Увеличение длины змейки
-            snake.length += 1
-            # Перемещение яблока
-            apple.randomize_position()
-            # Убеждаемся, что яблоко не появляется на теле змейки
-            while apple.position in snake.positions:
-                apple.randomize_position()
-
-        # Проверка столкновений змейки с самой собой
-        head_position = snake.get_head_position()
-        if head_position in snake.positions[1:]:
-            # Сброс игры при столкновении
-            print(f"Игра окончена! Счёт: {snake.length - 1}")
-            snake.reset()
-
-        # Отрисовка игровых объектов
-        screen.fill(BOARD_BACKGROUND_COLOR)  # Очистка экрана
-        snake.draw()  # Отрисовка змейки
-        apple.draw()  # Отрисовка яблока
-
-        # Обновление экрана
-        pygame.display.update()
+        game_tick(snake, apple)
 
 
 if __name__ == '__main__':
@@ -4,8 +4,12 @@ class Board:
 
     field_size = 3
 
-    def __init__(self):
-        self.board = [[' ' for _ in range(3)] for _ in range(3)]
+    def __init__(self, field_size=3):
+        self.field_size = field_size
+        self.board = [
+            [' ' for _ in range(self.field_size)]
+            for _ in range(self.field_size)
+        ]
 
     def make_move(self, row, col, player):
         self.board[row][col] = player
@@ -13,7 +17,7 @@ class Board:
     def display(self):
         for row in self.board:
             print('|'.join(row))
-            print('-' * 5)
+            print('-' * (self.field_size * 2 - 1))
 
     def is_board_full(self):
         # Цикл проходится по всем столбцам игрового поля.
@@ -30,15 +34,16 @@ class Board:
     # Этот метод будет определять победу.
     def check_win(self, player):
         # Тут реализована проверка по вертикали и горизонтали.
-        for i in range(3):
-            if (all([self.board[i][j] == player for j in range(3)]) or
-                    all([self.board[j][i] == player for j in range(3)])):
+        size = self.field_size
+        for i in range(size):
+            if (all([self.board[i][j] == player for j in range(size)]) or
+                    all([self.board[j][i] == player for j in range(size)])):
                 return True
         # Тут реализована проверка по диагонали.
         if (
-            self.board[0][0] == self.board[1][1] == self.board[2][2] == player
+            all([self.board[i][i] == player for i in range(size)])
             or
-            self.board[0][2] == self.board[1][1] == self.board[2][0] == player
+            all([self.board[i][size - 1 - i] == player for i in range(size)])
         ):
             return True
 
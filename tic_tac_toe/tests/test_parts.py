@@ -0,0 +1,80 @@
+import pytest
+
+from gameparts import Board
+
+
+FIELD_SIZES = (3, 5)
+
+
+def make_board(size, cells, player='X'):
+    board = Board(size)
+    for row, col in cells:
+        board.make_move(row, col, player)
+    return board
+
+
+def test_default_field_size():
+    board = Board()
+    assert board.field_size == 3
+    assert board.board == [[' '] * 3 for _ in range(3)]
+
+
+@pytest.mark.parametrize('size', FIELD_SIZES)
+def test_board_has_field_size_cells(size):
+    board = Board(size)
+    assert len(board.board) == size
+    assert all(len(row) == size for row in board.board)
+
+
+@pytest.mark.parametrize('size', FIELD_SIZES)
+def test_check_win_rows(size):
+    for row in range(size):
+        board = make_board(size, [(row, col) for col in range(size)])
+        assert board.check_win('X')
+        assert not board.check_win('O')
+
+
+@pytest.mark.parametrize('size', FIELD_SIZES)
+def test_check_win_columns(size):
+    for col in range(size):
+        board = make_board(size, [(row, col) for row in range(size)])
+        assert board.check_win('X')
+        assert not board.check_win('O')
+
+
+@pytest.mark.parametrize('size', FIELD_SIZES)
+def test_check_win_main_diagonal(size):
+    board = make_board(size, [(i, i) for i in range(size)])
+    assert board.check_win('X')
+
+
+@pytest.mark.parametrize('size', FIELD_SIZES)
+def test_check_win_anti_diagonal(size):
+    board = make_board(size, [(i, size - 1 - i) for i in range(size)])
+    assert board.check_win('X')
+
+
+@pytest.mark.parametrize('size', FIELD_SIZES)
+def test_incomplete_line_is_not_win(size):
+    board = make_board(size, [(0, col) for col in range(size - 1)])
+    assert not board.check_win('X')
+
+
+def test_draw_board_is_full_without_winner():
+    board = Board()
+    for row, line in enumerate(('XOX', 'XOO', 'OXX')):
+        for col, player in enumerate(line):
+            board.make_move(row, col, player)
+    assert board.is_board_full()
+    assert not board.check_win('X')
+    assert not board.check_win('O')
+
+
+@pytest.mark.parametrize('size', FIELD_SIZES)
+def test_board_with_empty_cell_is_not_full(size):
+    board = make_board(
+        size, [(row, col) for row in range(size) for col in range(size)]
+    )
+    assert board.is_board_full()
+    board.board[size - 1][size - 1] = ' '
+    assert not board.is_board_full()